@@ -652,6 +652,14 @@ lowercasing can be applied to all comparison operations (i.e. ``eq``,
                 **kwargs,
             )
 
+.. tip:: The :class:`~.hybrid.Comparator` itself does not take part in
+   SQL compilation caching; the SQL expressions it produces do.  If a
+   hybrid's expression or comparator makes use of a custom SQL construct,
+   such as a :class:`.FunctionElement` subclass, that construct should set
+   the :attr:`.HasCacheKey.inherit_cache` flag so that statements which
+   refer to the hybrid continue to make use of the compiled cache.  See
+   :ref:`compilerext_caching` for background.
+
 .. _hybrid_reuse_subclass:
 
 Reusing Hybrid Properties across Subclasses
@@ -827,9 +835,11 @@ measurement, currencies and encrypted passwords.
 
 from __future__ import annotations
 
+import types
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
@@ -840,6 +850,7 @@ from typing import Type
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
+import weakref
 
 from .. import util
 from ..orm import attributes
@@ -851,11 +862,7 @@ from ..sql import roles
 from ..sql._typing import is_has_clause_element
 from ..sql.elements import ColumnElement
 from ..sql.elements import SQLCoreOperations
-from ..util.typing import Concatenate
-from ..util.typing import Literal
 from ..util.typing import ParamSpec
-from ..util.typing import Protocol
-from ..util.typing import Self
 
 if TYPE_CHECKING:
     from ..orm.interfaces import MapperProperty
@@ -866,6 +873,10 @@ if TYPE_CHECKING:
     from ..sql._typing import _HasClauseElement
     from ..sql._typing import _InfoType
     from ..sql.operators import OperatorType
+    from ..util.typing import Concatenate
+    from ..util.typing import Literal
+    from ..util.typing import Protocol
+    from ..util.typing import Self
 
 _P = ParamSpec("_P")
 _R = TypeVar("_R")
@@ -903,40 +914,45 @@ class HybridExtensionType(InspectionAttrExtensionType):
     """
 
 
-class _HybridGetterType(Protocol[_T_co]):
-    def __call__(s, self: Any) -> _T_co:
-        ...
-
-
-class _HybridSetterType(Protocol[_T_con]):
-    def __call__(s, self: Any, value: _T_con) -> None:
-        ...
-
+if TYPE_CHECKING:
 
-class _HybridUpdaterType(Protocol[_T_con]):
-    def __call__(
-        s,
-        cls: Any,
-        value: Union[_T_con, _ColumnExpressionArgument[_T_con]],
-    ) -> List[Tuple[_DMLColumnArgument, Any]]:
-        ...
+    class _HybridGetterType(Protocol[_T_co]):
+        def __call__(s, self: Any) -> _T_co:
+            ...
 
+    class _HybridSetterType(Protocol[_T_con]):
+        def __call__(s, self: Any, value: _T_con) -> None:
+            ...
 
-class _HybridDeleterType(Protocol[_T_co]):
-    def __call__(s, self: Any) -> None:
-        ...
+    class _HybridUpdaterType(Protocol[_T_con]):
+        def __call__(
+            s,
+            cls: Any,
+            value: Union[_T_con, _ColumnExpressionArgument[_T_con]],
+        ) -> List[Tuple[_DMLColumnArgument, Any]]:
+            ...
 
+    class _HybridDeleterType(Protocol[_T_co]):
+        def __call__(s, self: Any) -> None:
+            ...
 
-class _HybridExprCallableType(Protocol[_T_co]):
-    def __call__(
-        s, cls: Any
-    ) -> Union[_HasClauseElement, SQLColumnExpression[_T_co]]:
-        ...
+    class _HybridExprCallableType(Protocol[_T_co]):
+        def __call__(
+            s, cls: Any
+        ) -> Union[_HasClauseElement, SQLColumnExpression[_T_co]]:
+            ...
 
+    class _HybridComparatorCallableType(Protocol[_T]):
+        def __call__(self, cls: Any) -> Comparator[_T]:
+            ...
 
-class _HybridComparatorCallableType(Protocol[_T]):
-    def __call__(self, cls: Any) -> Comparator[_T]:
-        ...
+else:
+    _HybridGetterType = Callable[..., Any]
+    _HybridSetterType = Callable[..., Any]
+    _HybridUpdaterType = Callable[..., Any]
+    _HybridDeleterType = Callable[..., Any]
+    _HybridExprCallableType = Callable[..., Any]
+    _HybridComparatorCallableType = Callable[..., Any]
 
 
 class _HybridClassLevelAccessor(QueryableAttribute[_T]):
@@ -972,6 +988,11 @@ class hybrid_method(interfaces.InspectionAttrInfo, Generic[_P, _R]):
 
     """
 
+    __slots__ = ("func", "expr", "_plain_func", "__dict__")
+
+    func: Callable[Concatenate[Any, _P], _R]
+    expr: Callable[Concatenate[Any, _P], SQLCoreOperations[_R]]
+
     is_attribute = True
     extension_type = HybridExtensionType.HYBRID_METHOD
 
@@ -1000,10 +1021,13 @@ class hybrid_method(interfaces.InspectionAttrInfo, Generic[_P, _R]):
 
         """
         self.func = func
-        if expr is not None:
-            self.expression(expr)
+        # plain functions are bound directly; other callables such as
+        # partialmethod or staticmethod go through their own __get__()
+        self._plain_func = type(func) is types.FunctionType
+        if expr is None or expr is func:
+            self.expr = func  # type: ignore[assignment]
         else:
-            self.expression(func)  # type: ignore
+            self.expression(expr)
 
     @property
     def inplace(self) -> Self:
@@ -1039,6 +1063,8 @@ class hybrid_method(interfaces.InspectionAttrInfo, Generic[_P, _R]):
     ) -> Union[Callable[_P, _R], Callable[_P, SQLCoreOperations[_R]]]:
         if instance is None:
             return self.expr.__get__(owner, owner)  # type: ignore
+        elif self._plain_func:
+            return types.MethodType(self.func, instance)
         else:
             return self.func.__get__(instance, owner)  # type: ignore
 
@@ -1049,11 +1075,15 @@ class hybrid_method(interfaces.InspectionAttrInfo, Generic[_P, _R]):
         SQL-expression producing method."""
 
         self.expr = expr
-        if not self.expr.__doc__:
-            self.expr.__doc__ = self.func.__doc__
+        _inherit_doc(expr, self.func)
         return self
 
 
+def _inherit_doc(dst: Any, src: Any) -> None:
+    if dst is not src and not dst.__doc__:
+        dst.__doc__ = src.__doc__
+
+
 def _unwrap_classmethod(meth: _T) -> _T:
     if isinstance(meth, classmethod):
         return meth.__func__  # type: ignore
@@ -1067,10 +1097,35 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
 
     """
 
+    __slots__ = (
+        "fget",
+        "fset",
+        "fdel",
+        "expr",
+        "custom_comparator",
+        "update_expr",
+        "_attr_key",
+        "_expr_comparator",
+        "__name__",
+        "__dict__",
+    )
+
     is_attribute = True
     extension_type = HybridExtensionType.HYBRID_PROPERTY
 
+    # constructor arguments carried over by _copy()
+    _copy_fields = (
+        "fget",
+        "fset",
+        "fdel",
+        "expr",
+        "custom_comparator",
+        "update_expr",
+    )
+
     __name__: str
+    _attr_key: Optional[str]
+    _expr_comparator: Optional[Callable[[Any], _HybridClassLevelAccessor[_T]]]
 
     def __init__(
         self,
@@ -1103,8 +1158,18 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         self.expr = _unwrap_classmethod(expr)
         self.custom_comparator = _unwrap_classmethod(custom_comparator)
         self.update_expr = _unwrap_classmethod(update_expr)
+        self._attr_key = None
+        self._expr_comparator = None
         util.update_wrapper(self, fget)
 
+    def __set_name__(self, owner: Type[object], name: str) -> None:
+        # record the attribute key up front when we are assigned within
+        # a class body under the same name as our function.  assignments
+        # under other names, e.g. an alias, are left to the search
+        # through the MRO, and don't replace a key already recorded.
+        if name == self.__name__:
+            self._attr_key = name
+
     @overload
     def __get__(self, instance: Any, owner: Literal[None]) -> Self:
         ...
@@ -1122,12 +1187,27 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
     def __get__(
         self, instance: Optional[object], owner: Optional[Type[object]]
     ) -> Union[hybrid_property[_T], _HybridClassLevelAccessor[_T], _T]:
-        if owner is None:
+        # instance access is by far the most common case, so test for it
+        # first
+        if instance is not None and owner is not None:
+            return self.fget(instance)
+        elif owner is None:
             return self
-        elif instance is None:
-            return self._expr_comparator(owner)
         else:
-            return self.fget(instance)
+            return self._class_level_accessor(owner)
+
+    def _class_level_accessor(
+        self, owner: Type[object]
+    ) -> _HybridClassLevelAccessor[_T]:
+        expr_comparator = self._expr_comparator
+        if expr_comparator is None:
+            # built on first class-level access, as many hybrids are only
+            # ever used at the instance level; reset by in-place
+            # modification
+            expr_comparator = self._get_expr_comparator()
+            self._expr_comparator = expr_comparator
+
+        return expr_comparator(owner)
 
     def __set__(self, instance: object, value: Any) -> None:
         if self.fset is None:
@@ -1140,13 +1220,10 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         self.fdel(instance)
 
     def _copy(self, **kw: Any) -> hybrid_property[_T]:
-        defaults = {
-            key: value
-            for key, value in self.__dict__.items()
-            if not key.startswith("_")
-        }
-        defaults.update(**kw)
-        return type(self)(**defaults)
+        for key in self._copy_fields:
+            if key not in kw:
+                kw[key] = getattr(self, key)
+        return type(self)(**kw)
 
     @property
     def overrides(self) -> Self:
@@ -1199,6 +1276,7 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         def _set(self, **kw: Any) -> hybrid_property[_TE]:
             for k, v in kw.items():
                 setattr(self.attr, k, _unwrap_classmethod(v))
+            self.attr._expr_comparator = None
             return self.attr
 
         def getter(self, fget: _HybridGetterType[_TE]) -> hybrid_property[_TE]:
@@ -1387,8 +1465,7 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         """
         return self._copy(update_expr=meth)
 
-    @util.memoized_property
-    def _expr_comparator(
+    def _get_expr_comparator(
         self,
     ) -> Callable[[Any], _HybridClassLevelAccessor[_T]]:
         if self.custom_comparator is not None:
@@ -1396,7 +1473,9 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         elif self.expr is not None:
             return self._get_expr(self.expr)
         else:
-            return self._get_expr(cast(_HybridExprCallableType[_T], self.fget))
+            return self._get_expr(
+                cast("_HybridExprCallableType[_T]", self.fget)
+            )
 
     def _get_expr(
         self, expr: _HybridExprCallableType[_T]
@@ -1404,32 +1483,49 @@ class hybrid_property(interfaces.InspectionAttrInfo, ORMDescriptor[_T]):
         def _expr(cls: Any) -> ExprComparator[_T]:
             return ExprComparator(cls, expr(cls), self)
 
-        util.update_wrapper(_expr, expr)
+        # only the docstring is consumed, by _get_comparator()
+        _expr.__doc__ = expr.__doc__
 
         return self._get_comparator(_expr)
 
+    @util.memoized_property
+    def _proxy_attr(self) -> Callable[..., QueryableAttribute[Any]]:
+        # the Proxy class depends only on this hybrid, so it survives
+        # in-place modification of the hybrid's functions
+        return attributes.create_proxied_attribute(self)
+
+    @util.memoized_property
+    def _names_by_owner(self) -> weakref.WeakKeyDictionary[Any, str]:
+        # attribute names found by searching the MRO, for a hybrid that
+        # wasn't assigned within a class body
+        return weakref.WeakKeyDictionary()
+
     def _get_comparator(
         self, comparator: Any
     ) -> Callable[[Any], _HybridClassLevelAccessor[_T]]:
-        proxy_attr = attributes.create_proxied_attribute(self)
-
         def expr_comparator(
             owner: Type[object],
         ) -> _HybridClassLevelAccessor[_T]:
-            # because this is the descriptor protocol, we don't really know
-            # what our attribute name is.  so search for it through the
-            # MRO.
-            for lookup in owner.__mro__:
-                if self.__name__ in lookup.__dict__:
-                    if lookup.__dict__[self.__name__] is self:
-                        name = self.__name__
+            name = self._attr_key
+            if name is None:
+                name = self._names_by_owner.get(owner)
+            if name is None:
+                # we weren't assigned within a class body, so __set_name__
+                # was not called and we don't really know what our attribute
+                # name is.  so search for it through the MRO.  only a
+                # successful lookup is remembered, as the hybrid may yet be
+                # assigned to the class.
+                key = self.__name__
+                for lookup in owner.__mro__:
+                    if lookup.__dict__.get(key) is self:
+                        name = self._names_by_owner[owner] = key
                         break
-            else:
-                name = attributes._UNKNOWN_ATTR_KEY  # type: ignore[assignment]
+                else:
+                    name = attributes._UNKNOWN_ATTR_KEY  # type: ignore
 
             return cast(
                 "_HybridClassLevelAccessor[_T]",
-                proxy_attr(
+                self._proxy_attr(
                     owner,
                     name,
                     self,
@@ -1446,26 +1542,40 @@ class Comparator(interfaces.PropComparator[_T]):
     :class:`~.orm.interfaces.PropComparator`
     classes for usage with hybrids."""
 
+    # note that neither this class nor its PropComparator / ColumnOperators
+    # bases define __getattr__; doing so would route every attribute access
+    # on user-defined comparators through the slower "getattr hook" path
+    # and prevent the interpreter from specializing those lookups.  only
+    # ExprComparator, which proxies to the wrapped expression, has one.
+
+    __slots__ = ("expression", "_clause_element")
+
+    _clause_element: Optional[roles.ColumnsClauseRole]
+
     def __init__(
         self, expression: Union[_HasClauseElement, SQLColumnExpression[_T]]
     ):
         self.expression = expression
+        self._clause_element = None
 
     def __clause_element__(self) -> roles.ColumnsClauseRole:
+        # the expression is fixed for the life of the comparator, so it
+        # only needs to be resolved once.  subclasses may have overridden
+        # __init__ without calling it, so don't assume the slot is set.
+        ret_expr = getattr(self, "_clause_element", None)
+        if ret_expr is None:
+            ret_expr = self._clause_element = self._resolve_clause_element()
+        return ret_expr
+
+    def _resolve_clause_element(self) -> roles.ColumnsClauseRole:
         expr = self.expression
         if is_has_clause_element(expr):
-            ret_expr = expr.__clause_element__()
+            return expr.__clause_element__()
         else:
-            if TYPE_CHECKING:
-                assert isinstance(expr, ColumnElement)
-            ret_expr = expr
-
-        if TYPE_CHECKING:
             # see test_hybrid->test_expression_isnt_clause_element
             # that exercises the usual place this is caught if not
-            # true
-            assert isinstance(ret_expr, ColumnElement)
-        return ret_expr
+            # a ColumnElement
+            return expr  # type: ignore[return-value]
 
     @util.non_memoized_property
     def property(self) -> interfaces.MapperProperty[_T]:
@@ -1479,6 +1589,10 @@ class Comparator(interfaces.PropComparator[_T]):
 
 
 class ExprComparator(Comparator[_T]):
+    __slots__ = ("cls", "hybrid", "_proxied_attrs")
+
+    _proxied_attrs: Optional[Dict[str, Any]]
+
     def __init__(
         self,
         cls: Type[Any],
@@ -1488,9 +1602,21 @@ class ExprComparator(Comparator[_T]):
         self.cls = cls
         self.expression = expression
         self.hybrid = hybrid
+        self._clause_element = None
+        self._proxied_attrs = None
 
     def __getattr__(self, key: str) -> Any:
-        return getattr(self.expression, key)
+        # the expression is fixed for the life of the comparator, so
+        # remember what's been proxied from it; this is only reached for
+        # names not otherwise present on the comparator
+        proxied_attrs = self._proxied_attrs
+        if proxied_attrs is None:
+            proxied_attrs = self._proxied_attrs = {}
+        elif key in proxied_attrs:
+            return proxied_attrs[key]
+
+        value = proxied_attrs[key] = getattr(self.expression, key)
+        return value
 
     @util.ro_non_memoized_property
     def info(self) -> _InfoType:
@@ -1504,7 +1630,7 @@ class ExprComparator(Comparator[_T]):
         elif self.hybrid.update_expr is not None:
             return self.hybrid.update_expr(self.cls, value)
         else:
-            return [(self.expression, value)]
+            return ((self.expression, value),)
 
     @util.non_memoized_property
     def property(self) -> MapperProperty[_T]:
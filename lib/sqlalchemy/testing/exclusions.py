@@ -88,12 +88,17 @@ class compound:
             fn._sa_exclusion_extend._extend(self)
             return fn
 
+        # further exclusions applied to the same function are added to
+        # this rule in place, so work from a copy; the rule itself may be
+        # shared, e.g. as returned by a memoized requirement
+        rule = self.add()
+
         @decorator
         def decorate(fn, *args, **kw):
-            return self._do(config._current, fn, *args, **kw)
+            return rule._do(config._current, fn, *args, **kw)
 
         decorated = decorate(fn)
-        decorated._sa_exclusion_extend = self
+        decorated._sa_exclusion_extend = rule
         return decorated
 
     @contextlib.contextmanager
@@ -1590,6 +1590,7 @@ class SuiteRequirements(Requirements):
             "Cython extensions not installed",
         )
 
+    @util.memoized_instancemethod
     def _has_sqlite(self):
         from sqlalchemy import create_engine
 
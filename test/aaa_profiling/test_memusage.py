@@ -23,6 +23,7 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.engine import result
 from sqlalchemy.engine.processors import to_decimal_processor_factory
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import clear_mappers
@@ -31,6 +32,7 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import join as orm_join
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import Load
+from sqlalchemy.orm import registry
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
@@ -66,6 +68,12 @@ class ASub(A):
     pass
 
 
+class HasHybrid:
+    @hybrid_property
+    def x_plus_one(self):
+        return self.x + 1
+
+
 def assert_cycles(expected=0):
     def decorate(fn):
         def go():
@@ -342,6 +350,30 @@ class MemUsageTest(EnsureZeroed):
 
         assert not eng.dialect._type_memos
 
+    def test_hybrid_on_mixin(self):
+        """a hybrid on a long-lived mixin doesn't hold onto the
+        mapped subclasses it was accessed from"""
+
+        reg = registry()
+        table = Table(
+            "sub",
+            reg.metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer),
+        )
+
+        @profile_memory()
+        def go():
+            class Sub(HasHybrid):
+                pass
+
+            reg.map_imperatively(Sub, table)
+            reg.configure()
+            Sub.x_plus_one
+            reg.dispose()
+
+        go()
+
     @testing.fails()
     def test_fixture_failure(self):
         class Foo:
@@ -0,0 +1,63 @@
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import exclusions
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_not
+
+
+class CompoundDecorateTest(fixtures.TestBase):
+    __backend__ = False
+
+    def test_shared_rule_not_mutated(self):
+        """a rule shared between tests, such as a memoized requirement,
+        isn't modified when further exclusions are stacked on a test
+        it decorates."""
+
+        shared = exclusions.skip_if(lambda config: False, "shared skip")
+        shared_skips = set(shared.skips)
+        shared_fails = set(shared.fails)
+
+        other_skip = exclusions.skip_if(lambda config: False, "other skip")
+        other_fail = exclusions.fails_if(lambda config: False, "other fail")
+
+        @other_fail
+        @shared
+        def fn_one():
+            pass
+
+        @other_skip
+        @shared
+        def fn_two():
+            pass
+
+        eq_(shared.skips, shared_skips)
+        eq_(shared.fails, shared_fails)
+
+        for fn in (fn_one, fn_two):
+            is_not(fn._sa_exclusion_extend, shared)
+
+        eq_(fn_one._sa_exclusion_extend.skips, shared_skips)
+        eq_(fn_one._sa_exclusion_extend.fails, other_fail.fails)
+
+        eq_(
+            fn_two._sa_exclusion_extend.skips,
+            shared_skips | other_skip.skips,
+        )
+        eq_(fn_two._sa_exclusion_extend.fails, set())
+
+    def test_shared_rule_applied_last(self):
+        shared = exclusions.fails_if(lambda config: False, "shared fail")
+        shared_fails = set(shared.fails)
+
+        other_skip = exclusions.skip_if(lambda config: False, "other skip")
+
+        @shared
+        @other_skip
+        def fn():
+            pass
+
+        eq_(shared.fails, shared_fails)
+        eq_(shared.skips, set())
+        eq_(other_skip.fails, set())
+
+        eq_(fn._sa_exclusion_extend.skips, other_skip.skips)
+        eq_(fn._sa_exclusion_extend.fails, shared_fails)
@@ -1,4 +1,6 @@
 from decimal import Decimal
+import functools
+import weakref
 
 from sqlalchemy import column
 from sqlalchemy import exc
@@ -12,10 +14,12 @@ from sqlalchemy import literal_column
 from sqlalchemy import Numeric
 from sqlalchemy import select
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy.ext import hybrid
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import column_property
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import declared_attr
 from sqlalchemy.orm import relationship
@@ -28,12 +32,14 @@ from sqlalchemy.sql import update
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.util import gc_collect
 
 
 class PropertyComparatorTest(fixtures.TestBase, AssertsCompiledSQL):
@@ -156,6 +162,56 @@ class PropertyComparatorTest(fixtures.TestBase, AssertsCompiledSQL):
         A = self._fixture()
         eq_(A.value.__doc__, "This is a docstring")
 
+    def test_comparator_has_no_getattr(self):
+        for cls in hybrid.Comparator.__mro__:
+            assert "__getattr__" not in cls.__dict__, cls
+
+    def test_comparator_slots(self):
+        expr = column("x")
+        for comparator in (
+            hybrid.Comparator(expr),
+            hybrid.ExprComparator(object, expr, hybrid.hybrid_property(None)),
+        ):
+            with expect_raises(AttributeError):
+                comparator.some_attribute = 5
+
+    def test_expr_comparator_proxied_attrs(self):
+        class Expression:
+            calls = 0
+
+            @property
+            def some_attr(self):
+                Expression.calls += 1
+                return "some value"
+
+        comparator = hybrid.ExprComparator(
+            object, Expression(), hybrid.hybrid_property(None)
+        )
+        is_(comparator._proxied_attrs, None)
+
+        eq_(comparator.some_attr, "some value")
+        eq_(comparator.some_attr, "some value")
+        eq_(Expression.calls, 1)
+
+        for i in range(2):
+            with expect_raises(AttributeError):
+                comparator.not_an_attr
+        eq_(comparator._proxied_attrs, {"some_attr": "some value"})
+
+    def test_clause_element_memoized(self):
+        A = self._fixture()
+        comparator = hybrid.Comparator(A._value)
+        expr = comparator.__clause_element__()
+        is_(comparator.__clause_element__(), expr)
+
+    def test_clause_element_subclass_no_super_init(self):
+        class MyComparator(hybrid.Comparator):
+            def __init__(self, expression):
+                self.expression = expression
+
+        expr = column("x")
+        is_(MyComparator(expr).__clause_element__(), expr)
+
     def test_no_name_one(self):
         """test :ticket:`6215`"""
 
@@ -214,6 +270,55 @@ class PropertyComparatorTest(fixtures.TestBase, AssertsCompiledSQL):
             ["same_name", "id", "name"],
         )
 
+    def test_name_assigned_after_class_creation(self):
+        Base = declarative_base()
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+        def same_name(self):
+            return self.id
+
+        def name1(self):
+            return self.name
+
+        A.same_name = hybrid.hybrid_property(same_name)
+        A.different_name = hybrid.hybrid_property(name1)
+
+        stmt = select(A.same_name, A.different_name)
+        compiled = stmt.compile()
+
+        eq_(
+            [ent._label_name for ent in compiled.compile_state._entities],
+            ["same_name", "name"],
+        )
+
+    def test_name_alias_in_class_body(self):
+        Base = declarative_base()
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+            @hybrid.hybrid_property
+            def upper_name(self):
+                return func.upper(self.name)
+
+            legacy_upper_name = upper_name
+
+        eq_(A.upper_name.key, "upper_name")
+
+        stmt = select(A.upper_name, A.legacy_upper_name)
+        compiled = stmt.compile()
+
+        eq_(
+            [ent._label_name for ent in compiled.compile_state._entities],
+            ["upper_name", "upper_name_1"],
+        )
+
     def test_custom_op(self, registry):
         """test #3162"""
 
@@ -577,6 +682,76 @@ class PropertyExpressionTest(fixtures.TestBase, AssertsCompiledSQL):
             A.value.__clause_element__(), "foo(a.value) + bar(a.value)"
         )
 
+    def test_expression_invoked_on_each_access(self, decl_base):
+        """the expression is evaluated for each class-level access, so
+        that it may embed values that change, e.g. the current time"""
+
+        values = iter(["x", "y"])
+
+        class A(decl_base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+
+            @hybrid.hybrid_property
+            def value(self):
+                return None
+
+            @value.expression
+            def value(cls):
+                return literal_column(next(values))
+
+        configure_mappers()
+
+        self.assert_compile(A.value, "x")
+        self.assert_compile(A.value, "y")
+
+    @testing.variation("use_classmethod", [True, False])
+    def test_class_level_reset_inplace(self, use_classmethod):
+        A = self._fixture(use_inplace=True, use_classmethod=use_classmethod)
+        configure_mappers()
+
+        v1 = A.value
+        self.assert_compile(v1, "foo(a.value) + bar(a.value)")
+
+        @A.value.overrides.inplace.expression
+        def _value_expr(cls):
+            return func.bat(cls._value)
+
+        v2 = A.value
+        is_not(v1, v2)
+        self.assert_compile(v2, "bat(a.value)")
+
+        # the proxy class is built once per hybrid
+        is_(type(v1), type(v2))
+
+    def test_class_level_after_remap(self, registry):
+        t = Table(
+            "a",
+            registry.metadata,
+            Column("id", Integer, primary_key=True),
+            Column("value", String),
+        )
+
+        class A:
+            @hybrid.hybrid_property
+            def value(self):
+                return self._value
+
+            @value.expression
+            def value(cls):
+                return func.foo(cls._value)
+
+        registry.map_imperatively(A, t, properties={"_value": t.c.value})
+        configure_mappers()
+
+        self.assert_compile(A.value, "foo(a.value)")
+
+        registry.dispose()
+        registry.map_imperatively(A, t, properties={"_value": t.c.value})
+        configure_mappers()
+
+        self.assert_compile(A.value, "foo(a.value)")
+
     def test_expression_isnt_clause_element(self):
         A = self._wrong_expr_fixture()
 
@@ -1146,6 +1321,68 @@ class MethodExpressionTest(fixtures.TestBase, AssertsCompiledSQL):
             aliased(A).value(5), "foo(a_1.value, :foo_1) + :foo_2"
         )
 
+    def test_expr_defaults_to_func(self):
+        def value(self, x):
+            return x
+
+        hm = hybrid.hybrid_method(value)
+        is_(hm.expr, value)
+        is_(hm.func, value)
+        is_(value.__doc__, None)
+
+        hm = hybrid.hybrid_method(value, value)
+        is_(hm.expr, value)
+
+    def test_instance_level_partialmethod(self):
+        class A:
+            def _add(self, x, y):
+                return self._value + x + y
+
+            value = hybrid.hybrid_method(functools.partialmethod(_add, 5))
+
+            @value.expression
+            @classmethod
+            def value(cls, y):
+                return y
+
+            def __init__(self, value):
+                self._value = value
+
+        eq_(A(3).value(2), 10)
+        eq_(A.value(7), 7)
+
+    def test_instance_level_staticmethod(self):
+        class A:
+            value = hybrid.hybrid_method(staticmethod(lambda x: x * 2))
+
+        eq_(A().value(4), 8)
+
+    def test_subclass_collected_after_dispose(self, registry):
+        class HasMethod:
+            @hybrid.hybrid_method
+            def value(self, x):
+                return self._value + x
+
+        class A(HasMethod):
+            pass
+
+        t = Table(
+            "a",
+            registry.metadata,
+            Column("id", Integer, primary_key=True),
+            Column("value", Integer),
+        )
+        registry.map_imperatively(A, t, properties={"_value": t.c.value})
+        configure_mappers()
+
+        self.assert_compile(A.value(5), "a.value + :value_1")
+
+        ref = weakref.ref(A)
+        registry.dispose()
+        del A
+        gc_collect()
+        is_(ref(), None)
+
     def test_query(self):
         A = self._fixture()
         sess = fixture_session()
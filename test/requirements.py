@@ -4,6 +4,7 @@
 """
 
 from sqlalchemy import exc
+from sqlalchemy import util
 from sqlalchemy.sql import sqltypes
 from sqlalchemy.sql import text
 from sqlalchemy.testing import exclusions
@@ -30,7 +31,7 @@ def exclude(db, op, spec, description=None):
 
 
 class DefaultRequirements(SuiteRequirements):
-    @property
+    @util.memoized_property
     def deferrable_or_no_constraints(self):
         """Target database must support deferrable constraints."""
 
@@ -69,7 +70,7 @@ class DefaultRequirements(SuiteRequirements):
 
         return skip_if([no_support("sqlite", "not supported by database")])
 
-    @property
+    @util.memoized_property
     def foreign_keys(self):
         """Target database must support foreign keys."""
 
@@ -174,7 +175,7 @@ class DefaultRequirements(SuiteRequirements):
     def constraint_comment_reflection(self):
         return only_on(["postgresql"])
 
-    @property
+    @util.memoized_property
     def unbounded_varchar(self):
         """Target database must support VARCHAR with no length"""
 
@@ -536,7 +537,7 @@ class DefaultRequirements(SuiteRequirements):
             'for update in FROM clause", resolved by MariaDB 10.3',
         )
 
-    @property
+    @util.memoized_property
     def savepoints(self):
         """Target database must support savepoints."""
 
@@ -675,7 +676,7 @@ class DefaultRequirements(SuiteRequirements):
             "no FOR UPDATE NOWAIT support",
         )
 
-    @property
+    @util.memoized_property
     def subqueries(self):
         """Target database must support subqueries."""
         return exclusions.open()
@@ -736,7 +737,7 @@ class DefaultRequirements(SuiteRequirements):
             ["mysql", "mariadb", "sqlite", "postgresql+psycopg2", "mssql"]
         )
 
-    @property
+    @util.memoized_property
     def intersect(self):
         """Target database must support INTERSECT or equivalent."""
 
@@ -745,7 +746,7 @@ class DefaultRequirements(SuiteRequirements):
             "no support for INTERSECT",
         )
 
-    @property
+    @util.memoized_property
     def except_(self):
         """Target database must support EXCEPT or equivalent (i.e. MINUS)."""
         return fails_if(
@@ -823,7 +824,7 @@ class DefaultRequirements(SuiteRequirements):
             + self.offset
         )
 
-    @property
+    @util.memoized_property
     def window_functions(self):
         return only_if(
             [
@@ -896,7 +897,7 @@ class DefaultRequirements(SuiteRequirements):
             + skip_if("oracle", "recovery not functional")
         )
 
-    @property
+    @util.memoized_property
     def views(self):
         """Target database must support VIEWs."""
         return exclusions.open()